@@ -1,6 +1,6 @@
 import os
 import typing_extensions
-from typing import Union, get_origin, get_args, Optional
+from typing import Iterable, Union, get_origin, get_args, Optional
 
 from ez_lib.types import basic_types
 
@@ -28,6 +28,59 @@ class InvalidAnnotatedType(Exception):
             f"got value '{field_value}'"
         )
 
+# Common spellings are matched as they are, others after lowercasing.
+_BOOL_ENV_VALUES = {
+    'true': True,
+    'True': True,
+    'TRUE': True,
+    'false': False,
+    'False': False,
+    'FALSE': False,
+}
+
+def _collect_annotations(cls: type) -> dict[str, type]:
+    """
+    Merge annotations of `cls` and all its bases (derived classes take
+    precedence). Falls back to `typing_extensions.get_type_hints()` only if
+    there are stringified (PEP 563) annotations which need to be evaluated.
+    """
+    ann = {}
+    for base in reversed(cls.__mro__):
+        ann.update(getattr(base, '__annotations__', {}))
+
+    for type_ in ann.values():
+        if isinstance(type_, str):
+            return typing_extensions.get_type_hints(cls)
+
+    return ann
+
+
+def _read_env(names: Iterable[str]) -> dict[str, str]:
+    """
+    Read environment variables `names` at once, unset variables are left out.
+
+    Reads the dict backing `os.environ` directly when available, since
+    `os.environ.get()` raises and catches KeyError for every unset variable.
+    """
+    environ = os.environ
+    env = {}
+    data = getattr(environ, '_data', None)
+    if data is None:
+        for name in names:
+            value = environ.get(name)
+            if value is not None:
+                env[name] = value
+    else:
+        encodekey = environ.encodekey
+        decodevalue = environ.decodevalue
+        for name in names:
+            value = data.get(encodekey(name))
+            if value is not None:
+                env[name] = decodevalue(value)
+
+    return env
+
+
 class BaseEnvConfig:
     """
     Set environment variables to class variables.
@@ -81,14 +134,35 @@ class BaseEnvConfig:
     If the type is wrongly annotated, `InvalidAnnotatedType` is thrown.
     """
 
+    # Resolved at class creation time by `__init_subclass__()`, so repeated
+    # `init()` calls don't have to reflect over the class again. `_typed`
+    # (dict[str, type]) and `_optional` (frozenset[str]) are None until
+    # resolved. Not annotated, as annotations are config variable types.
+    _config_var_names = ()
+    _typed = None
+    _optional = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._config_var_names = cls._get_config_var_names()
+        try:
+            cls._typed, cls._optional = cls._get_typed_and_opt()
+        except (NameError, TypeError):
+            # Annotations not resolvable yet (e.g. forward references), let
+            # `init()` resolve them lazily.
+            cls._typed = cls._optional = None
+
     @classmethod
     def init(cls):
-        typed, optional = cls._get_typed_and_opt()
-        for env_var_name in cls._get_config_var_names():
-            env_var_val = os.environ.get(env_var_name)
+        if cls._typed is None:
+            cls._typed, cls._optional = cls._get_typed_and_opt()
+
+        typed = cls._typed
+        env = _read_env(cls._config_var_names)
+        for env_var_name, env_var_val in env.items():
             if env_var_val:
-                if env_var_name in typed.keys():
-                    type_ = typed[env_var_name]
+                type_ = typed.get(env_var_name)
+                if type_ is not None:
                     try:
                         setattr(
                             cls, env_var_name, type_(env_var_val)
@@ -100,13 +174,13 @@ class BaseEnvConfig:
                 else:
                     setattr(cls, env_var_name, cls._type_env_var(env_var_val))
 
-        cls._check_all_vars(optional)
+        cls._check_all_vars()
 
     @classmethod
     def _get_typed_and_opt(cls):
         optional = []
         del_fields = []
-        typed = typing_extensions.get_type_hints(cls)
+        typed = _collect_annotations(cls)
         for field_name, field_type in typed.items():
             if get_origin(field_type) is Union:
                 optional.append(field_name)
@@ -118,44 +192,58 @@ class BaseEnvConfig:
         for field_name in del_fields:
             del typed[field_name]
 
-        return typed, optional
+        return typed, frozenset(optional)
 
     @classmethod
-    def _check_all_vars(cls, optional):
+    def _check_all_vars(cls):
         missing_vars = []
-        for attr_name in cls._get_config_var_names():
-            if getattr(cls, attr_name) is None and attr_name not in optional:
+        for attr_name in cls._config_var_names:
+            if (
+                    getattr(cls, attr_name) is None
+                    and attr_name not in cls._optional
+            ):
                 missing_vars.append(attr_name)
 
         if missing_vars:
             raise EmptyEnvVarError(missing_vars)
 
     @classmethod
-    def _get_config_var_names(cls):
-        config_var_names = []
-        for k in cls.__dict__.keys():
-            s = str(k)
-            if s.isupper():
-                config_var_names.append(s)
-
-        return config_var_names
+    def _get_config_var_names(cls) -> tuple[str, ...]:
+        return tuple(k for k in cls.__dict__.keys() if k.isupper())
 
     @staticmethod
     def _type_env_var(env_var: str | None) -> basic_types:
         if env_var is None:
             return None
 
-        if env_var.lower() == "false":
-            return False
-        elif env_var.lower() == "true":
-            return True
-        elif '.' in env_var:
-            try:
+        bool_ = _BOOL_ENV_VALUES.get(env_var)
+        if bool_ is None and 4 <= len(env_var) <= 5:
+            bool_ = _BOOL_ENV_VALUES.get(env_var.lower())
+        if bool_ is not None:
+            return bool_
+
+        is_float = '.' in env_var
+        digits = env_var[1:] if env_var[:1] == '-' else env_var
+        if is_float:
+            if (
+                    digits.count('.') == 1
+                    and digits.replace('.', '', 1).isdecimal()
+            ):
                 return float(env_var)
-            except ValueError:
-                return env_var
-        else:
+        elif digits.isdecimal():
             try:
                 return int(env_var)
             except ValueError:
+                # e.g. exceeds the int string conversion length limit
                 return env_var
+
+        # Not a plain number, only values starting like one (e.g. ' 42', '+1',
+        # '1_000', '1.5e3') are worth trying the (costly) failing conversion.
+        c = env_var[:1]
+        if not (c.isdecimal() or c.isspace() or c in '+-.'):
+            return env_var
+
+        try:
+            return float(env_var) if is_float else int(env_var)
+        except ValueError:
+            return env_var
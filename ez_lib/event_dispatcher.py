@@ -10,62 +10,87 @@ class AbstractEvent(Enum):
 
 
 class EventDispatcher:
+    __slots__ = ('_log', '_listeners', '_num_listeners', '__weakref__')
+
     def __init__(self, log: Logger = None):
         self._log = log
 
+        # A single listener is kept as a bare callable (the common case),
+        # multiple listeners in a tuple. Both are replaced on (rare)
+        # registration changes, so dispatching can use them directly, even
+        # if a callback (un)registers listeners while being dispatched.
         self._listeners: dict[
-            AbstractEvent, set[Callable[..., ...]]
+            AbstractEvent,
+            Callable[..., ...] | tuple[Callable[..., ...], ...]
         ] = {}
+        self._num_listeners = 0
 
     @property
     def num_listeners(self):
-        n = 0
-        for _, callbacks in self._listeners.items():
-            n += len(callbacks)
-        return n
+        return self._num_listeners
 
     def register_listener(
             self, event: AbstractEvent, callback: Callable[..., ...]
     ):
-        s = self._listeners.get(event)
-        if s is not None:
-            if callback in s:
-                if self._log:
-                    self._log.warning(
-                        f"EventDispatcher: Unable to register listener "
-                        f"'{callback.__name__}' for event "
-                        f"'{event}', already "
-                        f"registered."
-                    )
+        callbacks = self._get_callbacks(event)
+        if callback in callbacks:
+            if self._log:
+                self._log.warning(
+                    f"EventDispatcher: Unable to register listener "
+                    f"'{callback.__name__}' for event "
+                    f"'{event}', already "
+                    f"registered."
+                )
         else:
-            self._listeners.setdefault(event, set()).add(callback)
+            self._set_callbacks(event, (*callbacks, callback))
+            self._num_listeners += 1
 
     def unregister_listener(
             self, event: AbstractEvent, callback: Callable[..., ...]
     ):
-        s = self._listeners.get(event)
-        if s is not None:
-            if callback in s:
-                s.remove(callback)
-                if len(s) == 0:
-                    del self._listeners[event]
-            else:
-                self._log_non_existent_listener(event, callback)
+        callbacks = self._get_callbacks(event)
+        if callback in callbacks:
+            self._set_callbacks(
+                event, tuple(cb for cb in callbacks if cb != callback)
+            )
+            self._num_listeners -= 1
         else:
             self._log_non_existent_listener(event, callback)
 
     def dispatch_event(self, event: AbstractEvent, *args, **kwargs):
-        s = self._listeners.get(event).copy()
+        callbacks = self._listeners.get(event)
 
-        if s:
-            for callback in s:
-                callback(*args, **kwargs)
-        else:
+        if callbacks is None:
             if self._log:
                 self._log.debug(
                     "EventDispatcher: There are no registered listeners for "
                     f"event='{event}'"
                 )
+        elif type(callbacks) is tuple:
+            for callback in callbacks:
+                callback(*args, **kwargs)
+        else:
+            callbacks(*args, **kwargs)
+
+    def _get_callbacks(
+            self, event: AbstractEvent
+    ) -> tuple[Callable[..., ...], ...]:
+        callbacks = self._listeners.get(event, ())
+        if type(callbacks) is not tuple:
+            callbacks = (callbacks,)
+        return callbacks
+
+    def _set_callbacks(
+            self,
+            event: AbstractEvent,
+            callbacks: tuple[Callable[..., ...], ...]
+    ):
+        if len(callbacks) > 1:
+            self._listeners[event] = callbacks
+        elif callbacks:
+            self._listeners[event] = callbacks[0]
+        else:
+            del self._listeners[event]
 
     def _log_non_existent_listener(
             self, event: AbstractEvent, callback: Callable[..., ...]
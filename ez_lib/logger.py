@@ -11,6 +11,20 @@ class BaseLogModule(Enum):
 
 
 class LogConfig:
+    __slots__ = (
+        'log_module_cls',
+        'log_level',
+        'log_std_stream',
+        'log_file_path',
+        'log_file_max_size',
+        'log_file_backup_count',
+        'log_format',
+        'log_level_libs',
+        'log_level_libs_override',
+        '_formatter',
+        '__weakref__',
+    )
+
     def __init__(
             self,
             log_module_cls: type[BaseLogModule] | None = None,
@@ -53,6 +67,10 @@ class LogConfig:
         self.log_level_libs = log_level_libs
         self.log_level_libs_override = log_level_libs_override
 
+        # Formatter shared by all handlers created in `get_logger()`, built
+        # from `log_format` by `init_logging()` (or the first `get_logger()`)
+        self._formatter: logging.Formatter | None = None
+
 
 loggers = {}
 log_handlers = []
@@ -63,6 +81,7 @@ def init_logging(config: LogConfig, mute_libs=True):
     global log_config
     d = globals()
     log_config = config
+    config._formatter = logging.Formatter(config.log_format)
 
     if config.log_file_path:
         try:
@@ -89,10 +108,13 @@ def get_logger(module: BaseLogModule = None, log_level=None) -> logging.Logger:
 
     name = module.value if module else None
 
-    if name in loggers.keys():
-        log = loggers[name]
-        log.setLevel(log_level)
-        return loggers[name]
+    log = loggers.get(name)
+    if log is not None:
+        # `setLevel()` takes the logging module lock and clears the level
+        # cache of all loggers, do it only if the level actually changes.
+        if log.level != log_level:
+            log.setLevel(log_level)
+        return log
     else:
         log = logging.getLogger(name)
         loggers[name] = log
@@ -126,9 +148,12 @@ def get_logger(module: BaseLogModule = None, log_level=None) -> logging.Logger:
             lh.append(handler)
             log_handlers.append(handler)
 
+        if log_config._formatter is None:
+            log_config._formatter = logging.Formatter(log_config.log_format)
+
         for handler in lh:
             handler.setLevel(log_level)
-            handler.setFormatter(logging.Formatter(log_config.log_format))
+            handler.setFormatter(log_config._formatter)
             log.addHandler(handler)
             log.setLevel(log_level)
 
@@ -142,20 +167,15 @@ def set_lib_log_level():
     global log_config
     global loggers
 
-    loggers_ = [
-        logging.getLogger(name) for name in logging.root.manager.loggerDict
-        if name not in [lm.value for lm in log_config.log_module_cls]
-    ]
-
-    for logger in loggers_:
-        if logger not in loggers:
-            if (
-                    log_config.log_level_libs_override and
-                    logger.name in log_config.log_level_libs_override.keys()
-            ):
-                logger.setLevel(log_config.log_level_libs_override[logger.name])
-            else:
-                logger.setLevel(log_config.log_level_libs)
+    excluded = {lm.value for lm in log_config.log_module_cls}
+    level_override = log_config.log_level_libs_override or {}
+
+    # `getLogger()` replaces placeholders in `loggerDict`, iterate over a copy
+    for name in list(logging.root.manager.loggerDict):
+        if name not in excluded and name not in loggers:
+            logging.getLogger(name).setLevel(
+                level_override.get(name, log_config.log_level_libs)
+            )
 
 
 def destroy():
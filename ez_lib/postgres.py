@@ -1,7 +1,8 @@
 import contextlib
+import operator
 from ez_lib.types import json_ser
 from logging import Logger
-from typing import Iterable, Any
+from typing import Callable, Iterable, Any
 
 try:
     import sqlalchemy
@@ -16,8 +17,32 @@ except ImportError:
 
 if sqlalchemy:
 
+    # Logger of the last created `AsyncPgWrapper`, also used by Model helpers
+    _pg_log: Logger | None = None
+
+    # Sentinel for fields missing in the serialized dictionary
+    _MISSING = object()
+
+
     class AsyncPgWrapper:
-        log = None
+        __slots__ = (
+            '_host',
+            '_port',
+            '_user',
+            '_passwd',
+            '_db_name',
+            '_pool_size',
+            '_pool_max_overflow',
+            '_pool_timeout',
+            '_pool_recycle',
+            '_engine',
+            '_session_maker',
+            '_conn_str',
+            '_log',
+            '__weakref__',
+        )
+
+        _CONN_TMPL = 'postgresql+asyncpg://{user}:{passwd}@{host}:{port}/{db}'
 
         def __init__(
                 self,
@@ -41,12 +66,16 @@ if sqlalchemy:
             self._pool_max_overflow = pool_max_overflow
             self._pool_timeout = pool_timeout
             self._pool_recycle = pool_recycle
-            AsyncPgWrapper.log = log
+            self._log = log
+
+            global _pg_log
+            _pg_log = log
 
             self._engine: AsyncEngine | None = None
             self._session_maker: async_sessionmaker[
                                      AsyncSession
                                  ] | None = None
+            self._conn_str: str | None = None
 
         @property
         def engine(self):
@@ -57,8 +86,11 @@ if sqlalchemy:
             return self._session_maker
 
         async def init(self):
+            if self._conn_str is None:
+                self._conn_str = self._mk_conn_str()
+
             self._engine = create_async_engine(
-                self._mk_conn_str(),
+                self._conn_str,
                 pool_size=self._pool_size,
                 max_overflow=self._pool_max_overflow,
                 pool_timeout=self._pool_timeout,
@@ -73,8 +105,8 @@ if sqlalchemy:
                 class_=AsyncSession
             )
 
-            if AsyncPgWrapper.log:
-                AsyncPgWrapper.log.info("Postgres Connection Pool Created.")
+            if self._log:
+                self._log.info("Postgres Connection Pool Created.")
 
         @contextlib.asynccontextmanager
         async def get_session(self) -> AsyncSession:
@@ -87,8 +119,8 @@ if sqlalchemy:
             try:
                 yield session
             except BaseException as e:
-                if AsyncPgWrapper.log:
-                    AsyncPgWrapper.log.error(
+                if self._log:
+                    self._log.error(
                         f"Error during leased SQL Alchemy Postgres AsyncSession, "
                         f"Rolling Back the tx...\nerror={e}"
                     )
@@ -102,9 +134,12 @@ if sqlalchemy:
             self._engine.pool.dispose()
 
         def _mk_conn_str(self):
-            return (
-                f'postgresql+asyncpg://{self._user}:{self._passwd}@'
-                f'{self._host}:{self._port}/{self._db_name}'
+            return self._CONN_TMPL.format(
+                user=self._user,
+                passwd=self._passwd,
+                host=self._host,
+                port=self._port,
+                db=self._db_name
             )
 
 
@@ -115,6 +150,21 @@ if sqlalchemy:
     """
 
 
+    def _mk_values_getter(keys: tuple[str, ...]) -> Callable[[Any], tuple]:
+        """
+        Create getter fetching all `keys` attributes of an object at once,
+        always returning a tuple (even for a single or no key).
+        """
+        if not keys:
+            return lambda obj: ()
+
+        getter = operator.attrgetter(*keys)
+        if len(keys) == 1:
+            return lambda obj: (getter(obj),)
+
+        return getter
+
+
     class AbstractModelHelper(sqlalchemy.orm.DeclarativeBase):
         # Map fields with different names, e.g. { "my_id" : "id" }, where
         # "my_id" is property in our Model and "id" is defined in serialized
@@ -124,6 +174,10 @@ if sqlalchemy:
         # rather are defined only by us e.g. [ "id", "date_created" ]
         _except_fields = []
 
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            cls._except_fields = frozenset(cls._except_fields)
+
         def from_dict(self, d: json_ser, strict: bool = False):
             """
             Serialize all fields with the same name from `d` dictionary to 
@@ -139,36 +193,64 @@ if sqlalchemy:
             :param strict: If True, throw KeyError when field is not found in
                            `d` dictionary.
             """
-            for field_name in self.__class__.__dict__.keys():
+            for field_name, path, required in self._get_field_plan():
+                f = d
+                for key in path:
+                    f = f.get(key, _MISSING)
+                    if f is _MISSING:
+                        break
+
+                if f is _MISSING:
+                    if required:
+                        raise KeyError(key)
+                    self._log_field_not_found(field_name)
+                    if strict:
+                        raise KeyError(key)
+                else:
+                    setattr(self, field_name, f)
+
+        @classmethod
+        def _get_field_plan(cls) -> list[tuple[str, tuple[str, ...], bool]]:
+            # Built on first use rather than at class creation, so fields
+            # mapped later (deferred reflection, backrefs) are included. Read
+            # from the class' own `__dict__`, subclasses build their own.
+            plan = cls.__dict__.get('_field_plan')
+            if plan is None:
+                plan = cls._build_field_plan()
+                cls._field_plan = plan
+
+            return plan
+
+        @classmethod
+        def _build_field_plan(
+                cls
+        ) -> list[tuple[str, tuple[str, ...], bool]]:
+            """
+            Build `(field_name, path, required)` for every serializable field,
+            where `path` are keys leading to the field value in the serialized
+            dictionary and `required` fields (those in `cls._serialize_map`)
+            raise KeyError even when not `strict`.
+            """
+            plan = []
+            for field_name in cls.__dict__.keys():
                 if (
                         not field_name.startswith('_')
-                        and field_name not in self.__class__._except_fields
+                        and field_name not in cls._except_fields
                 ):
-                    if field_name in self.__class__._serialize_map.keys():
-                        setattr(
-                            self,
-                            field_name,
-                            d[self.__class__._serialize_map[field_name]]
+                    if field_name in cls._serialize_map.keys():
+                        plan.append(
+                            (
+                                field_name,
+                                (cls._serialize_map[field_name],),
+                                True
+                            )
                         )
                     else:
-                        if '__' not in field_name:
-                            try:
-                                setattr(self, field_name, d[field_name])
-                            except KeyError as e:
-                                self._log_field_not_found(field_name)
-                                if strict:
-                                    raise e
-                        else:
-                            arr = field_name.split('__')
-                            f = d
-                            try:
-                                for nested in arr:
-                                    f = f[nested]
-                                setattr(self, field_name, f)
-                            except KeyError as e:
-                                self._log_field_not_found(field_name)
-                                if strict:
-                                    raise e
+                        plan.append(
+                            (field_name, tuple(field_name.split('__')), False)
+                        )
+
+            return plan
 
         def to_values_dict(self, include: Iterable[str] = ()) -> dict:
             """
@@ -181,14 +263,37 @@ if sqlalchemy:
             otherwise excluded by `self._except_fields`. :return:
             """
 
+            if not include:
+                keys, getter = self._get_values_plan()
+                return dict(zip(keys, getter(self)))
+
             return {
                 c.key: getattr(self, c.key) for c in self.__table__.c
                 if (c.key not in self._except_fields or c.key in include)
             }
 
+        @classmethod
+        def _get_values_plan(
+                cls
+        ) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+            # Column keys returned by `to_values_dict()` by default and their
+            # getter, built on first use (same as `_get_field_plan()`) so
+            # columns mapped after class creation are included.
+            plan = cls.__dict__.get('_values_plan')
+            if plan is None:
+                keys = tuple(
+                    c.key for c in cls.__table__.c
+                    if c.key not in cls._except_fields
+                )
+                plan = (keys, _mk_values_getter(keys))
+                cls._values_plan = plan
+
+            return plan
+
         def _log_field_not_found(self, field_name: str):
-            if AsyncPgWrapper.log:
-                AsyncPgWrapper.log.debug(
+            log = _pg_log
+            if log is not None:
+                log.debug(
                     f"SqlAlchemy Model '{self.__class__.__name__}' field "
                     f"'{field_name}' not found."
                 )
@@ -249,11 +354,7 @@ if sqlalchemy:
 
         :return: list[type[AbstractModel]]
         """
-        ret = []
-        for item in select_result.mappings().all():
-            ret.append(item[model_cls_name])
-
-        return ret
+        return [item[model_cls_name] for item in select_result.mappings()]
 
 
     def model_list_to_dict(
@@ -273,11 +374,13 @@ if sqlalchemy:
         :raise: slack_bot.types.DictKeyMapError: When field named
                 `id_field_name` is not found on the model.
         """
-        d = {}
-        for model in models:
-            id_field = getattr(model, id_field_name)
-            if not id_field:
-                raise DictKeyMapError(model.__class__, id_field_name)
-            d[id_field] = model
+        get_id = operator.attrgetter(id_field_name)
+        d = {get_id(model): model for model in models}
+
+        if not all(d):
+            # Error path only, find the first Model with an empty id field
+            for model in models:
+                if not get_id(model):
+                    raise DictKeyMapError(model.__class__, id_field_name)
 
         return d